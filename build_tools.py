@@ -7,11 +7,29 @@ using uv's native capabilities where possible.
 """
 
 import argparse
+import compileall
+import hashlib
+import http.client
+import io
+import os
 import shutil
+import statistics
 import subprocess
 import sys
+import tarfile
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
 import webbrowser
+import zipapp
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, Optional
 
 try:
     import tomllib
@@ -57,6 +75,395 @@ def run_command(cmd: list[str], description: str, cwd: Path = None) -> bool:
         return False
 
 
+# Bump to invalidate every cached step output (e.g. when the archive format changes)
+CACHE_VERSION = "1"
+
+# Step inputs: glob patterns whose contents feed into the cache key
+CACHE_INPUTS = {
+    "docs": ["docs/**/*", "toolcraft/**/*.py", "pyproject.toml", "uv.lock"],
+    # Top-level modules such as build_tools.py are under test too
+    "coverage": [
+        "*.py",
+        "toolcraft/**/*.py",
+        "tests/**/*",
+        "pyproject.toml",
+        "uv.lock",
+    ],
+    "dist": [
+        "toolcraft/**/*",
+        "tests/**/*",
+        "docs/**/*",
+        "pyproject.toml",
+        "README.md",
+        "LICENSE",
+        "CHANGELOG.md",
+    ],
+    # build_tools.py holds the __main__ template and the compile/trim logic
+    "bundle": ["toolcraft/**/*.py", "build_tools.py", "pyproject.toml", "uv.lock"],
+}
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for the step cache."""
+
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+    bytes_downloaded: int = 0
+    bytes_uploaded: int = 0
+
+    def summary(self) -> str:
+        """Return a one-line human readable summary."""
+        lookups = self.hits + self.misses
+        rate = f"{self.hits / lookups:.0%}" if lookups else "n/a"
+        return (
+            f"{self.hits} hit(s), {self.misses} miss(es), {self.errors} error(s) "
+            f"(hit rate {rate}, "
+            f"{self.bytes_downloaded / 1024:.1f} KiB down, "
+            f"{self.bytes_uploaded / 1024:.1f} KiB up)"
+        )
+
+
+class CacheBackend:
+    """Base class for step cache storage backends."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the blob stored under ``key`` or None if it is missing."""
+        raise NotImplementedError
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` under ``key``."""
+        raise NotImplementedError
+
+
+class LocalCacheBackend(CacheBackend):
+    """Cache backend storing blobs in a local directory with LRU eviction."""
+
+    def __init__(self, directory: Path, max_size: int) -> None:
+        self.directory = Path(directory).expanduser()
+        self.max_size = max_size
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.tar.gz"
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        # Touch the entry so eviction treats it as recently used
+        os.utime(path)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, self._path(key))
+        except BaseException:
+            # e.g. ENOSPC: evict() only sees *.tar.gz, so don't leave it behind
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until under ``max_size`` bytes."""
+        entries = []
+        for path in self.directory.glob("*.tar.gz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+class HttpCacheBackend(CacheBackend):
+    """Cache backend using plain GET/PUT requests against ``<url>/<key>``."""
+
+    def __init__(self, url: str, timeout: float = 30.0) -> None:
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            with urllib.request.urlopen(
+                f"{self.url}/{key}", timeout=self.timeout
+            ) as response:
+                return response.read()
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+
+    def put(self, key: str, data: bytes) -> None:
+        request = urllib.request.Request(
+            f"{self.url}/{key}",
+            data=data,
+            method="PUT",
+            headers={"Content-Type": "application/gzip"},
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+def compute_cache_key(step: str, patterns: list[str], root: Path = None) -> str:
+    """Derive a content key for ``step`` from the files matching ``patterns``."""
+    root = root or Path.cwd()
+    files = set()
+    for pattern in patterns:
+        for path in root.glob(pattern):
+            if path.is_file() and "__pycache__" not in path.parts:
+                files.add(path)
+
+    digest = hashlib.sha256()
+    digest.update(f"{CACHE_VERSION}\0{step}\0".encode())
+    digest.update(f"{sys.version_info.major}.{sys.version_info.minor}\0".encode())
+    for path in sorted(files):
+        digest.update(path.relative_to(root).as_posix().encode() + b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return f"{step}-{digest.hexdigest()}"
+
+
+def pack_output(path: Path) -> bytes:
+    """Compress an output file or directory into an in-memory tar.gz archive."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        tar.add(path, arcname=path.name)
+    return buffer.getvalue()
+
+
+def check_member(member: tarfile.TarInfo, name: str) -> None:
+    """Raise ``tarfile.TarError`` unless ``member`` stays inside ``name``."""
+    parts = Path(member.name).parts
+    if member.name.startswith(("/", "\\")) or not parts or parts[0] != name:
+        raise tarfile.TarError(f"unexpected member {member.name!r}")
+    if ".." in parts:
+        raise tarfile.TarError(f"path traversal in {member.name!r}")
+    if not (member.isfile() or member.isdir() or member.issym() or member.islnk()):
+        raise tarfile.TarError(f"special file {member.name!r}")
+    if member.issym():
+        # Symlink targets are relative to the directory holding the link
+        target = os.path.normpath(
+            os.path.join(os.path.dirname(member.name), member.linkname)
+        )
+    elif member.islnk():
+        target = os.path.normpath(member.linkname)
+    else:
+        return
+    if os.path.isabs(member.linkname) or Path(target).parts[:1] != (name,):
+        raise tarfile.TarError(f"link {member.name!r} escapes the output")
+
+
+def extract_output(data: bytes, path: Path) -> Path:
+    """Extract an archive from ``pack_output`` into a staging dir next to ``path``.
+
+    Every member is validated before anything is written, so corrupt or
+    malicious cache entries raise without touching the existing ``path``.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{path.name}-", dir=path.parent))
+    try:
+        with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
+            members = tar.getmembers()
+            for member in members:
+                check_member(member, path.name)
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(staging, members=members, filter="data")
+            else:
+                tar.extractall(staging, members=members)
+        if not (staging / path.name).exists():
+            raise tarfile.TarError(f"archive does not contain {path.name!r}")
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return staging
+
+
+def replace_output(staging: Path, path: Path) -> None:
+    """Swap the output extracted by ``extract_output`` into ``path``."""
+    if path.is_dir():
+        shutil.rmtree(path)
+    elif path.exists():
+        path.unlink()
+    os.replace(staging / path.name, path)
+    shutil.rmtree(staging)
+
+
+# Errors from a backend or a cache entry that turn a lookup into a miss
+CACHE_ERRORS = (OSError, urllib.error.URLError, http.client.HTTPException, ValueError)
+
+
+class StepCache:
+    """Restore and store build step outputs through a ``CacheBackend``."""
+
+    def __init__(self, backend: CacheBackend, workers: int = 4) -> None:
+        self.backend = backend
+        self.workers = max(1, workers)
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        # Shared by downloads and uploads so transfers of all outputs overlap
+        self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        self._pending: list[Future] = []
+
+    def _entry_key(self, key: str, output: Path) -> str:
+        slug = output.as_posix().strip("/").replace("/", "_")
+        return f"{key}-{slug}"
+
+    def _download(self, key: str, output: Path) -> Optional[bytes]:
+        try:
+            return self.backend.get(self._entry_key(key, output))
+        except CACHE_ERRORS as e:
+            print(f"⚠️  Cache download failed for {output}: {e}")
+            with self._lock:
+                self.stats.errors += 1
+            return None
+
+    def _upload(self, key: str, output: Path) -> None:
+        try:
+            data = pack_output(output)
+            self.backend.put(self._entry_key(key, output), data)
+            with self._lock:
+                self.stats.bytes_uploaded += len(data)
+        except CACHE_ERRORS as e:
+            print(f"⚠️  Cache upload failed for {output}: {e}")
+            with self._lock:
+                self.stats.errors += 1
+
+    def restore(self, key: str, outputs: list[Path]) -> bool:
+        """Restore all ``outputs`` for ``key``; return False unless all were found."""
+        blobs = list(self._pool.map(lambda out: self._download(key, out), outputs))
+
+        if any(blob is None for blob in blobs):
+            self.stats.misses += 1
+            return False
+
+        staged = []
+        try:
+            for output, blob in zip(outputs, blobs):
+                staged.append((output, extract_output(blob, output)))
+        except (tarfile.TarError, EOFError, zlib.error, OSError) as e:
+            print(f"⚠️  Cache entry for {output} is unusable: {e}")
+            for _, staging in staged:
+                shutil.rmtree(staging, ignore_errors=True)
+            self.stats.errors += 1
+            self.stats.misses += 1
+            return False
+
+        try:
+            for output, staging in staged:
+                replace_output(staging, output)
+        except OSError as e:
+            print(f"⚠️  Restoring {output} from cache failed: {e}")
+            for _, staging in staged:
+                shutil.rmtree(staging, ignore_errors=True)
+            self.stats.errors += 1
+            self.stats.misses += 1
+            return False
+        self.stats.bytes_downloaded += sum(len(blob) for blob in blobs)
+        self.stats.hits += 1
+        return True
+
+    def store(self, key: str, outputs: list[Path], background: bool = False) -> None:
+        """Upload every existing output in ``outputs`` under ``key``.
+
+        With ``background`` the uploads keep running while the caller moves on
+        to the next step; ``wait()`` blocks until they have finished.
+        """
+        futures = [
+            self._pool.submit(self._upload, key, output)
+            for output in outputs
+            if output.exists()
+        ]
+        if background:
+            self._pending.extend(futures)
+        else:
+            for future in futures:
+                future.result()
+
+    def wait(self) -> None:
+        """Wait for all uploads started with ``store(..., background=True)``."""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+
+# Step cache, created lazily from configuration by get_cache()
+CACHE: Optional[StepCache] = None
+CACHE_ENABLED = True
+
+
+def create_cache_backend(config: dict) -> Optional[CacheBackend]:
+    """Create the cache backend selected by ``config`` (None when disabled)."""
+    backend = config.get("cache_backend", "local")
+    url = os.environ.get("BUILD_TOOLS_CACHE_URL") or config.get("cache_url", "")
+    if url:
+        backend = "http"
+
+    if backend == "local":
+        return LocalCacheBackend(
+            Path(config.get("cache_dir", ".build_cache")),
+            int(config.get("cache_max_size_mb", 1024)) * 1024 * 1024,
+        )
+    if backend == "http":
+        if not url:
+            print("⚠️  cache_backend is 'http' but no cache_url is configured")
+            return None
+        if urllib.parse.urlsplit(url).scheme not in ("http", "https"):
+            print(f"⚠️  Cache URL must start with http:// or https://, got {url!r}")
+            return None
+        return HttpCacheBackend(url, timeout=config.get("cache_timeout", 30))
+    if backend != "none":
+        print(f"⚠️  Unknown cache backend: {backend}")
+    return None
+
+
+def get_cache() -> Optional[StepCache]:
+    """Return the configured step cache, or None if caching is disabled."""
+    global CACHE, CACHE_ENABLED
+    if not CACHE_ENABLED:
+        return None
+    if CACHE is None:
+        backend = create_cache_backend(CONFIG)
+        if backend is None:
+            # Don't re-create (and re-warn) for every cached step
+            CACHE_ENABLED = False
+            return None
+        CACHE = StepCache(backend, workers=CONFIG.get("cache_workers", 4))
+    return CACHE
+
+
+def run_cached_step(
+    step: str, outputs: list[Path], description: str, func: Callable[[], bool]
+) -> bool:
+    """Run ``func`` unless the outputs for the current inputs are in the cache."""
+    cache = get_cache()
+    if cache is None:
+        return func()
+
+    key = compute_cache_key(step, CACHE_INPUTS[step])
+    if cache.restore(key, outputs):
+        print(f"♻️  {description} restored from cache ({key[:24]}...)")
+        return True
+
+    success = func()
+    if success:
+        # Each step writes its own outputs, so they can be packed and uploaded
+        # while the next step runs
+        cache.store(key, outputs, background=True)
+    return success
+
+
 def clean_build_dir(target: str = "all") -> bool:
     """Clean build directories."""
     build_dir = Path(CONFIG.get("build_dir", "build"))
@@ -78,6 +485,8 @@ def clean_build_dir(target: str = "all") -> bool:
         "coverage": build_dir / "coverage",
         "pytest": build_dir / "pytest_cache",
         "dist": dist_dir,
+        "bundle": Path(CONFIG.get("bundle_dir", "build/bundle")),
+        "cache": Path(CONFIG.get("cache_dir", ".build_cache")).expanduser(),
     }
 
     if target in targets:
@@ -100,28 +509,43 @@ def build_docs(clean: bool = False) -> bool:
         clean_build_dir("docs")
 
     docs_build_dir = CONFIG.get("docs_build_dir", "build/docs")
-    return run_uv_command(
-        [
-            "run",
-            "doc-builder",
-            "build",
-            "toolcraft",
-            "docs",
-            "--build_dir",
-            docs_build_dir,
-        ],
+    return run_cached_step(
+        "docs",
+        [Path(docs_build_dir)],
         "Building documentation",
+        lambda: run_uv_command(
+            [
+                "run",
+                "doc-builder",
+                "build",
+                "toolcraft",
+                "docs",
+                "--build_dir",
+                docs_build_dir,
+            ],
+            "Building documentation",
+        ),
     )
 
 
 def run_tests(coverage: bool = True) -> bool:
     """Run tests using uv."""
     cmd = ["run", "pytest"]
-    if coverage:
-        cmd.extend(["--cov=toolcraft"])
-
-    return run_uv_command(
-        cmd, "Running tests with coverage" if coverage else "Running tests"
+    if not coverage:
+        return run_uv_command(cmd, "Running tests")
+
+    cmd.extend(["--cov=toolcraft"])
+    # Separate cache entries (see [tool.coverage.*]) transfer concurrently
+    coverage_build_dir = Path(CONFIG.get("build_dir", "build")) / "coverage"
+    return run_cached_step(
+        "coverage",
+        [
+            coverage_build_dir / ".coverage",
+            coverage_build_dir / "coverage.xml",
+            Path(CONFIG.get("coverage_dir", "build/coverage/html")),
+        ],
+        "Running tests with coverage",
+        lambda: run_uv_command(cmd, "Running tests with coverage"),
     )
 
 
@@ -167,7 +591,269 @@ def format_code() -> bool:
 def build_package() -> bool:
     """Build distribution packages using uv."""
     clean_build_dir("dist")
-    return run_uv_command(["build"], "Building distribution packages")
+    return run_cached_step(
+        "dist",
+        [Path(CONFIG.get("dist_dir", "dist"))],
+        "Building distribution packages",
+        lambda: run_uv_command(["build"], "Building distribution packages"),
+    )
+
+
+# __main__ of the zipapp: drop site-packages from the import path so that every
+# import is served from the archive, then hand over to the click command.
+BUNDLE_MAIN = '''"""Entry point for the bundled toolcraft zipapp."""
+
+import sys
+
+if "site" in sys.modules:
+    import site
+
+    _site_dirs = set(site.getsitepackages()) | {site.getusersitepackages()}
+    # sys.path[0] is the archive itself, even when it lives in site-packages
+    sys.path[1:] = [p for p in sys.path[1:] if p not in _site_dirs]
+
+from toolcraft.main import main  # noqa: E402
+
+main(prog_name="toolcraft")
+'''
+
+# Invocations traced to find which staged top-level packages the CLI imports
+BUNDLE_TRACE_ARGS = [[], ["--version"], ["--help"]]
+
+BUNDLE_TRACE = """import os
+import sys
+
+staging = sys.argv[1]
+sys.path.insert(0, staging)
+from toolcraft.main import main
+
+for args in {args!r}:
+    try:
+        main(args, prog_name="toolcraft")
+    except SystemExit:
+        pass
+for module in list(sys.modules.values()):
+    path = getattr(module, "__file__", None) or ""
+    if path.startswith(staging):
+        print("@", os.path.relpath(path, staging).split(os.sep)[0])
+"""
+
+
+def stage_bundle(staging: Path) -> bool:
+    """Install toolcraft and its locked runtime dependencies into ``staging``.
+
+    Dependencies come from ``uv.lock`` (which is part of the bundle cache key)
+    rather than a fresh resolution, so every machine bundles the same versions.
+    """
+    requirements = staging.parent / "requirements.txt"
+    install = ["pip", "install", "--target", str(staging), "--python", sys.executable]
+    return (
+        run_uv_command(
+            [
+                "export",
+                "--frozen",
+                "--no-dev",
+                "--no-hashes",
+                "--no-emit-project",
+                "--output-file",
+                str(requirements),
+            ],
+            "Exporting locked runtime dependencies",
+        )
+        and run_uv_command(
+            install + ["--no-deps", "-r", str(requirements)],
+            "Installing locked dependencies for bundling",
+        )
+        and run_uv_command(
+            install + ["--no-deps", "."], "Installing toolcraft for bundling"
+        )
+    )
+
+
+def trim_bundle(staging: Path) -> bool:
+    """Remove staged packages (and their metadata) the CLI never imports."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-I",
+            "-S",
+            "-c",
+            BUNDLE_TRACE.format(args=BUNDLE_TRACE_ARGS),
+            str(staging),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(f"❌ Tracing bundle imports failed:\n{result.stderr}")
+        return False
+    used = {line[2:] for line in result.stdout.splitlines() if line.startswith("@ ")}
+
+    for entry in list(staging.iterdir()):
+        if entry.name.endswith(".dist-info"):
+            record = entry / "RECORD"
+            owned = set()
+            if record.exists():
+                for row in record.read_text().splitlines():
+                    owned.add(row.split(",")[0].split("/")[0])
+            if owned & used:
+                continue
+        elif entry.name in used or entry.name.split(".")[0] in used:
+            continue
+        print(f"✂️  Dropping unused {entry.name} from bundle")
+        if entry.is_dir():
+            shutil.rmtree(entry)
+        else:
+            entry.unlink()
+    return True
+
+
+def write_bundle(
+    staging: Path,
+    target: Path,
+    optimize: int = 1,
+    interpreter: str = "/usr/bin/env python3",
+    trim: bool = False,
+) -> bool:
+    """Precompile ``staging`` and write it as a zipapp to ``target``."""
+    for name in ("bin", "Scripts"):
+        if (staging / name).is_dir():
+            shutil.rmtree(staging / name)
+    for cache_dir in list(staging.rglob("__pycache__")):
+        shutil.rmtree(cache_dir)
+    if trim and not trim_bundle(staging):
+        return False
+
+    native = [p for p in staging.rglob("*") if p.suffix in (".so", ".pyd")]
+    if native:
+        print(f"❌ Cannot bundle extension modules: {', '.join(map(str, native))}")
+        return False
+    (staging / "__main__.py").write_text(BUNDLE_MAIN)
+
+    # zipimport only picks up legacy (sourceless) .pyc files next to the module
+    print(f"🔨 Precompiling bundle with optimization level {optimize}...")
+    if not compileall.compile_dir(
+        str(staging), quiet=1, legacy=True, optimize=optimize
+    ):
+        print("❌ Precompiling bundle failed")
+        return False
+    # zipapp requires __main__.py; its matching .pyc is still used at runtime
+    for source in staging.rglob("*.py"):
+        if source != staging / "__main__.py":
+            source.unlink()
+
+    # Stored (uncompressed) members avoid inflating every module at import time
+    target.parent.mkdir(parents=True, exist_ok=True)
+    zipapp.create_archive(staging, target, interpreter=interpreter, compressed=False)
+    print(f"✅ Bundle written to {target} ({target.stat().st_size / 1024:.0f} KiB)")
+    return True
+
+
+def build_bundle() -> bool:
+    """Build a self-contained, precompiled zipapp of the toolcraft CLI."""
+    bundle_dir = Path(CONFIG.get("bundle_dir", "build/bundle"))
+    target = bundle_dir / "toolcraft.pyz"
+
+    def build() -> bool:
+        if bundle_dir.exists():
+            shutil.rmtree(bundle_dir)
+        with tempfile.TemporaryDirectory() as tmp:
+            staging = Path(tmp) / "staging"
+            if not stage_bundle(staging):
+                return False
+            return write_bundle(
+                staging,
+                target,
+                optimize=CONFIG.get("bundle_optimize", 1),
+                interpreter=CONFIG.get("bundle_interpreter", "/usr/bin/env python3"),
+                trim=CONFIG.get("bundle_trim", False),
+            )
+
+    return run_cached_step("bundle", [bundle_dir], "Building zipapp bundle", build)
+
+
+def benchmark_startup(
+    commands: dict[str, list[str]], runs: int = 10, env: Optional[dict] = None
+) -> dict:
+    """Return the median wall-clock startup time in seconds of each command."""
+    results = {}
+    for name, cmd in commands.items():
+        # Warm-up run so both commands start with a hot filesystem cache
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, check=True, env=env)
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, check=True, env=env)
+            timings.append(time.perf_counter() - start)
+        results[name] = statistics.median(timings)
+        print(f"⏱️  {name}: {results[name] * 1000:.1f} ms (median of {runs})")
+    return results
+
+
+def run_bundle_benchmark(runs: int = 10) -> bool:
+    """Compare ``toolcraft --version`` startup of the entry point and the bundle.
+
+    The warm scenario lets the entry point use its ``__pycache__``. The cold
+    scenario mimics a fresh container where site-packages was installed
+    without bytecode: both commands read and write bytecode only under an
+    empty ``pycache_prefix`` that is pre-filled with the stdlib modules the
+    CLI needs, so only toolcraft and its dependencies are compiled from
+    source by the entry point.
+    """
+    target = Path(CONFIG.get("bundle_dir", "build/bundle")) / "toolcraft.pyz"
+    if not target.exists():
+        print("❌ Bundle not found. Build it first with: uv run build-tools bundle")
+        return False
+
+    entry_point = shutil.which("toolcraft")
+    if not entry_point:
+        print("⚠️  toolcraft entry point not found on PATH, benchmarking bundle only")
+    zipapp_cmd = [sys.executable, "-I", "-S", str(target), "--version"]
+
+    results = {}
+    try:
+        with tempfile.TemporaryDirectory() as prefix:
+            # Writes stdlib bytecode (including site) only, as the bundled
+            # modules are served from the zip
+            prewarm_env = dict(os.environ)
+            prewarm_env.pop("PYTHONDONTWRITEBYTECODE", None)
+            subprocess.run(
+                [sys.executable, "-X", f"pycache_prefix={prefix}", str(target)],
+                stdout=subprocess.DEVNULL,
+                check=True,
+                env=prewarm_env,
+            )
+            # Scenario: (environment for the entry point, flags for the zipapp)
+            scenarios = {
+                "warm": ({}, []),
+                "cold": (
+                    {"PYTHONPYCACHEPREFIX": prefix, "PYTHONDONTWRITEBYTECODE": "1"},
+                    ["-B", "-X", f"pycache_prefix={prefix}"],
+                ),
+            }
+            for scenario, (extra_env, flags) in scenarios.items():
+                print(f"🚀 Benchmarking {scenario} startup over {runs} runs...")
+                commands = {}
+                if entry_point:
+                    commands["entry point"] = [entry_point, "--version"]
+                commands["zipapp"] = zipapp_cmd[:1] + flags + zipapp_cmd[1:]
+                env = {**os.environ, **extra_env}
+                results[scenario] = benchmark_startup(commands, runs=runs, env=env)
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Startup benchmark failed with exit code {e.returncode}")
+        return False
+
+    if entry_point:
+        print()
+        for scenario, timings in results.items():
+            delta = (timings["entry point"] - timings["zipapp"]) * 1000
+            speedup = timings["entry point"] / timings["zipapp"]
+            print(
+                f"📊 {scenario}: zipapp {timings['zipapp'] * 1000:.1f} ms vs "
+                f"entry point {timings['entry point'] * 1000:.1f} ms "
+                f"({delta:+.1f} ms saved, {speedup:.2f}x)"
+            )
+    return True
 
 
 def publish_package(test: bool = False) -> bool:
@@ -273,12 +959,25 @@ def run_all_checks() -> bool:
         if not success:
             all_passed = False
 
+    cache = get_cache()
+    if cache is not None:
+        cache.wait()
+        print(f"Cache: {cache.stats.summary()}")
+
     print(
         f"\nOverall: {'✅ ALL CHECKS PASSED' if all_passed else '❌ SOME CHECKS FAILED'}"
     )
     return all_passed
 
 
+def positive_int(value: str) -> int:
+    """Parse a command line argument as an integer of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Main function."""
     parser = argparse.ArgumentParser(
@@ -292,11 +991,13 @@ Examples:
   uv run build-tools lint                # Run linting
   uv run build-tools format              # Format code
   uv run build-tools build               # Build distribution
+  uv run build-tools bundle --benchmark  # Build zipapp and time its startup
   uv run build-tools publish --test      # Test publish to TestPyPI
   uv run build-tools publish             # Publish to PyPI
   uv run build-tools check               # Run all quality checks
   uv run build-tools preview-docs        # Preview docs with doc-builder
   uv run build-tools serve-coverage      # Serve coverage reports
+  uv run build-tools --no-cache check    # Run checks without the step cache
 
 Alternative usage:
   uv run build_tools.py <command>        # Direct script usage
@@ -312,8 +1013,14 @@ Direct uv equivalents:
 
 Configuration:
   Settings are read from [tool.build_tools] section in pyproject.toml
+  Set BUILD_TOOLS_CACHE_URL to share step outputs through an HTTP cache
         """,
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't restore or store step outputs in the build cache",
+    )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
@@ -321,7 +1028,7 @@ Configuration:
     clean_parser = subparsers.add_parser("clean", help="Clean build artifacts")
     clean_parser.add_argument(
         "--target",
-        choices=["all", "docs", "coverage", "pytest", "dist"],
+        choices=["all", "docs", "coverage", "pytest", "dist", "bundle", "cache"],
         default="all",
         help="What to clean (default: all)",
     )
@@ -366,6 +1073,21 @@ Configuration:
     # Build and publish commands
     subparsers.add_parser("build", help="Build distribution packages")
 
+    bundle_parser = subparsers.add_parser(
+        "bundle", help="Build a precompiled zipapp of the toolcraft CLI"
+    )
+    bundle_parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Compare startup time of the bundle with the installed entry point",
+    )
+    bundle_parser.add_argument(
+        "--runs",
+        type=positive_int,
+        default=CONFIG.get("benchmark_runs", 10),
+        help="Number of timed runs per command (default: %(default)s)",
+    )
+
     publish_parser = subparsers.add_parser("publish", help="Publish package")
     publish_parser.add_argument(
         "--test", action="store_true", help="Publish to TestPyPI instead of PyPI"
@@ -380,6 +1102,10 @@ Configuration:
         parser.print_help()
         return
 
+    if args.no_cache:
+        global CACHE_ENABLED
+        CACHE_ENABLED = False
+
     # Execute commands
     success = True
 
@@ -412,12 +1138,19 @@ Configuration:
     elif args.command == "build":
         success = build_package()
 
+    elif args.command == "bundle":
+        success = build_bundle()
+        if success and args.benchmark:
+            success = run_bundle_benchmark(runs=args.runs)
+
     elif args.command == "publish":
         success = publish_package(test=args.test)
 
     elif args.command == "check":
         success = run_all_checks()
 
+    if CACHE is not None:
+        CACHE.wait()
     sys.exit(0 if success else 1)
 
 
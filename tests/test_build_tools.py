@@ -0,0 +1,515 @@
+"""Tests for the build-tools step cache and zipapp bundle."""
+
+import argparse
+import errno
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import threading
+import time
+import zipapp
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import click
+import pytest
+
+import build_tools
+import toolcraft
+from build_tools import (
+    HttpCacheBackend,
+    LocalCacheBackend,
+    StepCache,
+    benchmark_startup,
+    compute_cache_key,
+    write_bundle,
+)
+
+
+class _CacheHandler(BaseHTTPRequestHandler):
+    """Stand-in for a shared cache server keeping blobs in memory."""
+
+    store: dict = {}
+    truncate = False
+
+    def do_GET(self):
+        data = self.store.get(self.path)
+        if data is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        # A truncating server announces more bytes than it sends
+        length = len(data) + 100 if self.truncate else len(data)
+        self.send_header("Content-Length", str(length))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_PUT(self):
+        length = int(self.headers["Content-Length"])
+        self.store[self.path] = self.rfile.read(length)
+        self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def cache_server():
+    """Serve an in-memory cache over HTTP on a free local port."""
+    _CacheHandler.store = {}
+    _CacheHandler.truncate = False
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CacheHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/cache"
+    server.shutdown()
+    server.server_close()
+
+
+def _make_outputs(root):
+    docs = root / "build" / "docs"
+    (docs / "en").mkdir(parents=True)
+    (docs / "en" / "index.html").write_text("<h1>ToolCraft</h1>")
+    dist = root / "dist"
+    dist.mkdir()
+    (dist / "toolcraft-0.1.0.tar.gz").write_bytes(b"sdist")
+    return [docs, dist]
+
+
+def test_compute_cache_key_tracks_inputs(tmp_path):
+    """Test that the key changes with input contents only."""
+    (tmp_path / "pyproject.toml").write_text("[project]\n")
+    key = compute_cache_key("docs", ["pyproject.toml"], root=tmp_path)
+    assert key.startswith("docs-")
+    assert key == compute_cache_key("docs", ["pyproject.toml"], root=tmp_path)
+    assert key != compute_cache_key("dist", ["pyproject.toml"], root=tmp_path)
+
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+    assert key != compute_cache_key("docs", ["pyproject.toml"], root=tmp_path)
+
+
+def test_step_cache_roundtrip_local(tmp_path):
+    """Test storing and restoring outputs through the local backend."""
+    outputs = _make_outputs(tmp_path)
+    cache = StepCache(LocalCacheBackend(tmp_path / "cache", 10 * 1024 * 1024))
+
+    assert not cache.restore("docs-abc", outputs)
+    cache.store("docs-abc", outputs)
+    (outputs[0] / "en" / "index.html").write_text("stale")
+    (outputs[1] / "extra.whl").write_bytes(b"leftover")
+
+    assert cache.restore("docs-abc", outputs)
+    assert (outputs[0] / "en" / "index.html").read_text() == "<h1>ToolCraft</h1>"
+    assert sorted(p.name for p in outputs[1].iterdir()) == ["toolcraft-0.1.0.tar.gz"]
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.errors) == (1, 1, 0)
+    assert cache.stats.bytes_uploaded > 0
+    assert "hit rate 50%" in cache.stats.summary()
+
+
+def test_coverage_key_tracks_top_level_modules(tmp_path):
+    """Test that editing build_tools.py or test data invalidates coverage."""
+    (tmp_path / "build_tools.py").write_text("A = 1\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "data.json").write_text("{}")
+    patterns = build_tools.CACHE_INPUTS["coverage"]
+    key = compute_cache_key("coverage", patterns, root=tmp_path)
+
+    (tmp_path / "build_tools.py").write_text("A = 2\n")
+    edited = compute_cache_key("coverage", patterns, root=tmp_path)
+    assert edited != key
+
+    (tmp_path / "tests" / "data.json").write_text("[]")
+    assert compute_cache_key("coverage", patterns, root=tmp_path) != edited
+
+
+def test_step_cache_corrupt_entry_is_miss(tmp_path):
+    """Test that an unreadable entry is a miss and keeps existing outputs."""
+    outputs = _make_outputs(tmp_path)
+    backend = LocalCacheBackend(tmp_path / "cache", 10 * 1024 * 1024)
+    cache = StepCache(backend)
+    cache.store("docs-abc", outputs)
+    backend.put(cache._entry_key("docs-abc", outputs[1]), b"not a tarball")
+
+    assert not cache.restore("docs-abc", outputs)
+    assert (outputs[1] / "toolcraft-0.1.0.tar.gz").read_bytes() == b"sdist"
+    assert (cache.stats.misses, cache.stats.errors) == (1, 1)
+    assert sorted(p.name for p in outputs[0].parent.iterdir()) == ["docs"]
+
+
+@pytest.mark.parametrize(
+    "name, kind, linkname",
+    [
+        ("../evil.txt", tarfile.REGTYPE, ""),
+        ("out/../../evil.txt", tarfile.REGTYPE, ""),
+        ("/tmp/evil.txt", tarfile.REGTYPE, ""),
+        ("out/link", tarfile.SYMTYPE, "../../etc/passwd"),
+        ("out/link", tarfile.SYMTYPE, "/etc/passwd"),
+        ("out/hard", tarfile.LNKTYPE, "other/file"),
+        ("out/dev", tarfile.CHRTYPE, ""),
+    ],
+)
+def test_step_cache_rejects_unsafe_members(tmp_path, name, kind, linkname):
+    """Test that archives writing outside the output are refused."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        member = tarfile.TarInfo(name)
+        member.type = kind
+        member.linkname = linkname
+        tar.addfile(member, io.BytesIO(b""))
+    backend = LocalCacheBackend(tmp_path / "cache", 10 * 1024 * 1024)
+    cache = StepCache(backend)
+    output = tmp_path / "work" / "out"
+    backend.put(cache._entry_key("dist-abc", output), buffer.getvalue())
+
+    assert not cache.restore("dist-abc", [output])
+    assert cache.stats.errors == 1
+    assert not (tmp_path / "evil.txt").exists()
+    assert list((tmp_path / "work").iterdir()) == []
+
+
+def test_local_backend_evicts_least_recently_used(tmp_path):
+    """Test that size-based eviction drops the oldest unused entries."""
+    backend = LocalCacheBackend(tmp_path, max_size=250)
+    backend.put("a", b"a" * 100)
+    backend.put("b", b"b" * 100)
+    os.utime(tmp_path / "a.tar.gz", (1000, 1000))
+    os.utime(tmp_path / "b.tar.gz", (2000, 2000))
+    assert backend.get("a") is not None  # mark "a" as recently used
+    backend.put("c", b"c" * 100)
+
+    assert backend.get("a") is not None
+    assert backend.get("b") is None
+    assert backend.get("c") is not None
+
+
+def test_step_cache_roundtrip_http(tmp_path, cache_server):
+    """Test sharing outputs between two caches through the HTTP backend."""
+    outputs = _make_outputs(tmp_path)
+    StepCache(HttpCacheBackend(cache_server)).store("dist-abc", outputs)
+    assert len(_CacheHandler.store) == 2
+
+    for output in outputs:
+        shutil.rmtree(output)
+
+    other = StepCache(HttpCacheBackend(cache_server))
+    assert other.restore("dist-abc", outputs)
+    assert (outputs[1] / "toolcraft-0.1.0.tar.gz").read_bytes() == b"sdist"
+    assert not other.restore("dist-missing", outputs)
+    assert (other.stats.hits, other.stats.misses) == (1, 1)
+
+
+def test_step_cache_http_errors_are_misses(tmp_path):
+    """Test that an unreachable cache server degrades to a cache miss."""
+    outputs = _make_outputs(tmp_path)
+    cache = StepCache(HttpCacheBackend("http://127.0.0.1:9", timeout=1))
+    assert not cache.restore("docs-abc", outputs)
+    cache.store("docs-abc", outputs)
+    assert cache.stats.misses == 1
+    assert cache.stats.errors == 4
+
+
+def test_step_cache_http_truncated_body_is_miss(tmp_path, cache_server):
+    """Test that a server cutting off the response body degrades to a miss."""
+    outputs = _make_outputs(tmp_path)
+    StepCache(HttpCacheBackend(cache_server)).store("dist-abc", outputs)
+    _CacheHandler.truncate = True
+
+    cache = StepCache(HttpCacheBackend(cache_server, timeout=5))
+    assert not cache.restore("dist-abc", outputs)
+    assert (cache.stats.misses, cache.stats.errors) == (1, 2)
+    assert (outputs[1] / "toolcraft-0.1.0.tar.gz").read_bytes() == b"sdist"
+
+
+def test_step_cache_http_url_without_scheme_is_miss(tmp_path):
+    """Test that an unusable URL counts as errors instead of crashing."""
+    outputs = _make_outputs(tmp_path)
+    cache = StepCache(HttpCacheBackend("cache.example.internal/toolcraft"))
+    assert not cache.restore("docs-abc", outputs)
+    cache.store("docs-abc", outputs)
+    assert (cache.stats.misses, cache.stats.errors) == (1, 4)
+
+
+def test_create_cache_backend_rejects_url_without_scheme(monkeypatch, capsys):
+    """Test that a cache URL without http(s) scheme disables the cache."""
+    monkeypatch.setenv("BUILD_TOOLS_CACHE_URL", "cache.example.internal/toolcraft")
+    assert build_tools.create_cache_backend({}) is None
+    assert "must start with http:// or https://" in capsys.readouterr().out
+
+    monkeypatch.setenv("BUILD_TOOLS_CACHE_URL", "https://cache.example.internal/")
+    assert isinstance(build_tools.create_cache_backend({}), HttpCacheBackend)
+
+
+class _SlowBackend(build_tools.CacheBackend):
+    """Backend recording how many transfers are in flight at once."""
+
+    def __init__(self):
+        self.blobs = {}
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        self.release = threading.Event()
+        self.release.set()
+
+    def _transfer(self):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        self.release.wait(5)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+
+    def get(self, key):
+        self._transfer()
+        return self.blobs.get(key)
+
+    def put(self, key, data):
+        self._transfer()
+        self.blobs[key] = data
+
+
+def test_step_cache_transfers_concurrently(tmp_path):
+    """Test that outputs are uploaded and downloaded in parallel."""
+    outputs = _make_outputs(tmp_path)
+    outputs.append(tmp_path / "coverage.xml")
+    outputs[-1].write_text("<coverage/>")
+    backend = _SlowBackend()
+    cache = StepCache(backend, workers=4)
+
+    cache.store("coverage-abc", outputs)
+    assert backend.max_active == 3
+
+    backend.max_active = 0
+    assert cache.restore("coverage-abc", outputs)
+    assert backend.max_active == 3
+
+
+def test_step_cache_background_store(tmp_path):
+    """Test that background uploads run until wait() is called."""
+    outputs = _make_outputs(tmp_path)
+    backend = _SlowBackend()
+    backend.release.clear()
+    cache = StepCache(backend)
+
+    cache.store("docs-abc", outputs, background=True)
+    assert backend.blobs == {}
+    backend.release.set()
+    cache.wait()
+    assert len(backend.blobs) == 2
+
+
+def test_local_backend_put_cleans_up_on_failure(tmp_path, monkeypatch):
+    """Test that a failed write does not leave temporary files behind."""
+    backend = LocalCacheBackend(tmp_path, max_size=1024)
+
+    def replace(src, dst):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(build_tools.os, "replace", replace)
+    with pytest.raises(OSError):
+        backend.put("a", b"data")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_step_cache_replace_failure_is_miss(tmp_path, monkeypatch):
+    """Test that failing to swap in restored outputs counts as a miss."""
+    outputs = _make_outputs(tmp_path)
+    cache = StepCache(LocalCacheBackend(tmp_path / "cache", 10 * 1024 * 1024))
+    cache.store("docs-abc", outputs)
+
+    def replace_output(staging, path):
+        raise OSError(errno.EACCES, "Permission denied")
+
+    monkeypatch.setattr(build_tools, "replace_output", replace_output)
+    assert not cache.restore("docs-abc", outputs)
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.errors) == (0, 1, 1)
+    assert sorted(p.name for p in outputs[0].parent.iterdir()) == ["docs"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["build", "cache", "dist"]
+
+
+def test_run_cached_step_skips_on_hit(tmp_path, monkeypatch):
+    """Test that a cached step is only executed once for the same inputs."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pyproject.toml").write_text("[project]\n")
+    cache = StepCache(LocalCacheBackend(tmp_path / "cache", 10 * 1024 * 1024))
+    monkeypatch.setattr(build_tools, "CACHE", cache)
+    monkeypatch.setattr(build_tools, "CACHE_INPUTS", {"docs": ["pyproject.toml"]})
+
+    calls = []
+
+    def step():
+        calls.append(1)
+        (tmp_path / "out").mkdir(exist_ok=True)
+        (tmp_path / "out" / "result.txt").write_text("built")
+        return True
+
+    outputs = [tmp_path / "out"]
+    assert build_tools.run_cached_step("docs", outputs, "Docs", step)
+    cache.wait()
+    shutil.rmtree(tmp_path / "out")
+    assert build_tools.run_cached_step("docs", outputs, "Docs", step)
+    assert len(calls) == 1
+    assert (tmp_path / "out" / "result.txt").read_text() == "built"
+
+
+def test_get_cache_disables_once(monkeypatch, capsys):
+    """Test that an unusable configuration warns once and disables caching."""
+    monkeypatch.delenv("BUILD_TOOLS_CACHE_URL", raising=False)
+    monkeypatch.setattr(build_tools, "CONFIG", {"cache_backend": "http"})
+    monkeypatch.setattr(build_tools, "CACHE", None)
+    monkeypatch.setattr(build_tools, "CACHE_ENABLED", True)
+
+    assert build_tools.get_cache() is None
+    assert build_tools.get_cache() is None
+    assert capsys.readouterr().out.count("no cache_url") == 1
+
+
+def test_write_bundle_runs_sourceless(tmp_path):
+    """Test that the zipapp holds only precompiled modules and runs isolated."""
+    staging = tmp_path / "staging"
+    for package in (toolcraft, click):
+        source = Path(package.__file__).parent
+        shutil.copytree(source, staging / source.name)
+    target = tmp_path / "bundle" / "toolcraft.pyz"
+
+    assert write_bundle(staging, target)
+    names = zipfile.ZipFile(target).namelist()
+    assert "__main__.pyc" in names
+    assert "toolcraft/main.pyc" in names
+    assert [name for name in names if name.endswith(".py")] == ["__main__.py"]
+
+    result = subprocess.run(
+        [sys.executable, "-I", "-S", str(target), "--version"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "ToolCraft, version 0.1.0" in result.stdout
+
+    result = subprocess.run(
+        [sys.executable, "-I", "-S", str(target), "--help"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "Usage: toolcraft" in result.stdout
+    assert "ToolCraft - A comprehensive toolkit" in result.stdout
+
+
+def test_write_bundle_trims_unused_packages(tmp_path):
+    """Test that packages the CLI never imports are left out of the bundle."""
+    staging = tmp_path / "staging"
+    for package in (toolcraft, click):
+        source = Path(package.__file__).parent
+        shutil.copytree(source, staging / source.name)
+    (staging / "toolcraft-0.1.0.dist-info").mkdir()
+    (staging / "toolcraft-0.1.0.dist-info" / "RECORD").write_text(
+        "toolcraft/__init__.py,,\n"
+    )
+    (staging / "unused").mkdir()
+    (staging / "unused" / "__init__.py").write_text("")
+    (staging / "unused-1.0.dist-info").mkdir()
+    (staging / "unused-1.0.dist-info" / "RECORD").write_text("unused/__init__.py,,\n")
+    (staging / "unused_native.so").write_bytes(b"")
+
+    # Site-packages in the archive path must not hide the bundled modules
+    target = tmp_path / "site-packages" / "toolcraft.pyz"
+    assert write_bundle(staging, target, trim=True)
+    names = zipfile.ZipFile(target).namelist()
+    assert "toolcraft-0.1.0.dist-info/RECORD" in names
+    assert not [name for name in names if name.startswith("unused")]
+
+    result = subprocess.run(
+        [sys.executable, "-I", str(target), "--version"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "ToolCraft, version 0.1.0" in result.stdout
+
+
+def test_write_bundle_keeps_dependencies_by_default(tmp_path):
+    """Test that declared dependencies stay in the bundle unless trimming."""
+    staging = tmp_path / "staging"
+    shutil.copytree(Path(toolcraft.__file__).parent, staging / "toolcraft")
+    (staging / "rich").mkdir()
+    (staging / "rich" / "__init__.py").write_text("")
+    target = tmp_path / "toolcraft.pyz"
+
+    assert write_bundle(staging, target)
+    assert "rich/__init__.pyc" in zipfile.ZipFile(target).namelist()
+
+
+def test_stage_bundle_installs_from_lock(tmp_path, monkeypatch):
+    """Test that bundle dependencies are installed from uv.lock only."""
+    calls = []
+
+    def run_uv_command(cmd, description):
+        calls.append(cmd)
+        return True
+
+    monkeypatch.setattr(build_tools, "run_uv_command", run_uv_command)
+    assert build_tools.stage_bundle(tmp_path / "staging")
+
+    export, deps, project = calls
+    assert export[0] == "export" and "--frozen" in export
+    assert "--no-dev" in export and "--no-emit-project" in export
+    requirements = export[export.index("--output-file") + 1]
+    assert deps[deps.index("-r") + 1] == requirements
+    assert "--no-deps" in deps and "--no-deps" in project
+    assert project[-1] == "."
+
+
+def test_bundle_key_tracks_build_tools(tmp_path):
+    """Test that editing the bundle template invalidates the cached bundle."""
+    (tmp_path / "build_tools.py").write_text("BUNDLE_MAIN = 'a'\n")
+    patterns = build_tools.CACHE_INPUTS["bundle"]
+    key = compute_cache_key("bundle", patterns, root=tmp_path)
+    (tmp_path / "build_tools.py").write_text("BUNDLE_MAIN = 'b'\n")
+    assert compute_cache_key("bundle", patterns, root=tmp_path) != key
+
+
+def test_write_bundle_rejects_extension_modules(tmp_path):
+    """Test that staging with native extensions is refused."""
+    (tmp_path / "staging").mkdir()
+    (tmp_path / "staging" / "native.so").write_bytes(b"")
+    assert not write_bundle(
+        tmp_path / "staging", tmp_path / "toolcraft.pyz", trim=False
+    )
+    assert not (tmp_path / "toolcraft.pyz").exists()
+
+
+def test_benchmark_startup():
+    """Test that the benchmark reports a median timing per command."""
+    results = benchmark_startup({"python": [sys.executable, "-c", "pass"]}, runs=2)
+    assert list(results) == ["python"]
+    assert results["python"] > 0
+
+
+def test_positive_int_rejects_zero():
+    """Test that --runs must be at least 1."""
+    assert build_tools.positive_int("3") == 3
+    with pytest.raises(argparse.ArgumentTypeError):
+        build_tools.positive_int("0")
+
+
+def test_run_bundle_benchmark_reports_failures(tmp_path, monkeypatch, capsys):
+    """Test that a failing entry point is reported instead of raising."""
+    app = tmp_path / "app"
+    app.mkdir()
+    (app / "__main__.py").write_text("")
+    zipapp.create_archive(app, tmp_path / "toolcraft.pyz")
+    failing = tmp_path / "toolcraft"
+    failing.write_text("#!/bin/sh\nexit 3\n")
+    failing.chmod(0o755)
+    monkeypatch.setattr(build_tools, "CONFIG", {"bundle_dir": str(tmp_path)})
+    monkeypatch.setattr(build_tools.shutil, "which", lambda name: str(failing))
+
+    assert not build_tools.run_bundle_benchmark(runs=1)
+    assert "failed with exit code 3" in capsys.readouterr().out